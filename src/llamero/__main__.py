@@ -1,13 +1,11 @@
-import fire
 from loguru import logger
 from pathlib import Path
 
-from .summary.concatenative import SummaryGenerator
-from .summary.python_files import PythonSummariesGenerator
-from .tree_generator import generate_tree
-from .dir2doc import compile_template_dir
 from .utils import commit_and_push, commit_and_push_to_branch, get_project_root, load_config
 
+# Command implementations are imported inside the commands that use them,
+# so that startup (e.g. `llamero --help`) only pays for what actually runs
+
 
 def build_template(
     template_dir: str | Path, 
@@ -24,6 +22,8 @@ def build_template(
         variables: Optional variables to pass to template rendering
         commit: Whether to commit changes to git
     """
+    from .dir2doc import compile_template_dir
+    
     template_path = Path(template_dir)
     if not template_path.is_absolute():
         template_path = get_project_root() / template_path
@@ -61,6 +61,8 @@ def tree(root=".", output: str | None = None, commit: bool = True) -> None:
         output: Optional output path. Defaults to docs/readme/sections/structure.md.j2
         commit: Whether to commit changes to git
     """
+    from .tree_generator import generate_tree
+    
     tree_content = generate_tree(root)
     
     if not tree_content:
@@ -120,8 +122,6 @@ class Summarize:
     
     def __init__(self, root: str | Path ='.'):
         self.root = root
-        self._concatenative = SummaryGenerator(self.root)
-        self._python = PythonSummariesGenerator(self.root)
 
     def _finish(self, files: list[str|Path] ):
         commit_and_push_to_branch(
@@ -133,12 +133,14 @@ class Summarize:
 
     def main(self):
         """Generates concatenative summaries"""
-        generated_files = self._concatenative.generate_all_summaries()
+        from .summary.concatenative import SummaryGenerator
+        generated_files = SummaryGenerator(self.root).generate_all_summaries()
         self._finish(generated_files)
 
     def python(self):
         """Generates summaries for python code"""
-        generated_files = self._python.generate_summaries()
+        from .summary.python_files import PythonSummariesGenerator
+        generated_files = PythonSummariesGenerator(self.root).generate_summaries()
         self._finish(generated_files)
 
     def tree(self):
@@ -157,6 +159,7 @@ class Summarize:
 
 
 def cli():
+    import fire
     fire.Fire({
         'build_template': build_template,
         'tree': tree,
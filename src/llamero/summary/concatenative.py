@@ -1,9 +1,84 @@
 # src/llamero/summary/concatenative.py
 """Core summary generation functionality."""
+import hashlib
+import io
+import os
+import re
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set
+from typing import BinaryIO, Dict, Iterator, List, Sequence, Tuple
 from loguru import logger
 
+# Listing, stat and read calls release the GIL, so the walk, the file reads and
+# the summary writes each overlap their I/O on a pool of this many threads
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Large enough that files under the default size limit are copied in one read
+COPY_BUFSIZE = 1 << 20
+
+# Files larger than this are copied in-kernel with os.sendfile where possible
+SENDFILE_THRESHOLD = 64 * 1024
+
+def _copy_file(src: BinaryIO, out: BinaryIO) -> None:
+    """Copy an open file into an output stream, in-kernel with os.sendfile for large files."""
+    if hasattr(os, 'sendfile'):
+        try:
+            out_fd = out.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            out_fd = None
+        
+        size = os.fstat(src.fileno()).st_size if out_fd is not None else 0
+        if size > SENDFILE_THRESHOLD:
+            out.flush()
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(out_fd, src.fileno(), offset, size - offset)
+                    if not sent:
+                        break
+                    offset += sent
+                return
+            except OSError:
+                # Not supported for this pair of files, copy the rest normally
+                src.seek(offset)
+    
+    shutil.copyfileobj(src, out, COPY_BUFSIZE)
+
+def _read_whole(path: str, size: int) -> bytes:
+    """Read a whole file of a known size with raw file descriptor calls."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        chunks = [os.read(fd, size)]
+        # Pick up anything appended since the size was taken, as a plain read() would
+        while chunk := os.read(fd, COPY_BUFSIZE):
+            chunks.append(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+# Fixed parts of a file's summary section
+SECTION_HEADER_START = b'---\nFile: '
+SECTION_HEADER_END = b'\n---\n'
+SECTION_END = b'\n\n'
+
+def _section_header(rel_path: str) -> bytes:
+    """Format the header line of a file's summary section."""
+    return b''.join((SECTION_HEADER_START, os.fsencode(rel_path), SECTION_HEADER_END))
+
+def _in_workflows_dir(parts: Sequence[str]) -> bool:
+    """Check whether directory path components lie within a .github/workflows directory."""
+    return any(
+        part == '.github' and next_part == 'workflows'
+        for part, next_part in zip(parts, parts[1:])
+    )
+
+def _map_posix_path(path: str) -> str:
+    """Map a posix path, rewriting a .github/workflows pair of components to github/workflows."""
+    # Pad with separators so the replacement only ever matches whole components
+    return f"/{path}/".replace("/.github/workflows/", "/github/workflows/", 1)[1:-1]
+
 class SummaryGenerator:
     """Generate summary files for each directory in the project."""
     
@@ -26,38 +101,82 @@ class SummaryGenerator:
     def __init__(self, root_dir: str | Path):
         """Initialize generator with root directory."""
         self.root_dir = Path(root_dir).resolve()
+        # Prefix stripped from walked paths to get them relative to root
+        self._root_prefix = os.path.join(str(self.root_dir), '')
+        # Walked directories inherit this from root without having to check it again
+        self._root_in_workflows = _in_workflows_dir(self.root_dir.parts)
         self.workflow_mapping = {}  # Track workflow directory mappings
+        # Results of the public should_include_directory by path; the walk
+        # decides on relative paths directly and does not use it
+        self._directory_cache: Dict[str, bool] = {}
+        # Formatted sections from earlier runs, by posix path relative to root,
+        # with the (mtime_ns, size) they were read at and their digest
+        self._section_cache: Dict[str, Tuple[int, int, bytes, bytes]] = {}
+        # Digests of the summaries this generator wrote, by relative directory,
+        # with the (mtime_ns, size) the SUMMARY file had afterwards
+        self._summary_digests: Dict[str, Tuple[int, int, bytes]] = {}
+        self._skipped_lock = threading.Lock()
+        self.skipped_writes = 0  # Summaries left untouched by the last run
         self._load_user_config()
+        self._compile_exclusions()
         
     def _load_user_config(self) -> None:
         """Load and merge user configuration with defaults."""
         try:
-            config_path = self.root_dir / "pyproject.toml"
-            if config_path.exists():
-                from ..utils import load_config
-                parsed_config = load_config(str(config_path))
+            from ..utils import load_config
+            try:
+                parsed_config = load_config(str(self.root_dir / "pyproject.toml"))
                 user_config = parsed_config.get("tool", {}).get("summary", {})
-            else:
+            except FileNotFoundError:
                 user_config = {}
                 
             # Start with defaults
-            self.config = self.DEFAULT_CONFIG.copy()
+            self.config = self._copy_config(self.DEFAULT_CONFIG)
             
             # Update with user config
-            for key, value in user_config.items():
-                if key in self.config and isinstance(value, list):
-                    self.config[key] = value
-                else:
-                    self.config[key] = value
-                    
-            # Set max file size
-            self.max_file_size = self.config.get("max_file_size_kb", 500) * 1024
+            self.config.update(self._copy_config(user_config))
             
         except Exception as e:
             logger.warning(f"Error loading config: {e}, using defaults")
-            self.config = self.DEFAULT_CONFIG.copy()
-            self.max_file_size = self.config["max_file_size_kb"] * 1024
+            self.config = self._copy_config(self.DEFAULT_CONFIG)
+        
+        # Set max file size, derived in one place from the merged config
+        self.max_file_size = self.config["max_file_size_kb"] * 1024
 
+    @staticmethod
+    def _copy_config(config: dict) -> dict:
+        """Copy a config mapping and its list values, so no shared config is aliased."""
+        return {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in config.items()
+        }
+
+    def _compile_exclusions(self) -> None:
+        """Compile the exclusion rules into a regex over relative paths and lookups for the walk."""
+        # Literal forms of the same rules, for checking a single directory name
+        # while walking without going through the regex engine
+        self._excluded_directory_names = frozenset(self.config["exclude_directories"])
+        self._excluded_prefixes = tuple(self.config["exclude_patterns"])
+        # Hashed lookup for the extension check every candidate file goes through
+        self._include_extensions = frozenset(self.config["include_extensions"])
+        
+        alternatives = []
+        if self.config["exclude_directories"]:
+            directories = '|'.join(re.escape(d) for d in self.config["exclude_directories"])
+            alternatives.append(f'(?:{directories})(?:/|$)')
+        # Patterns are matched against single components, so ones spanning
+        # a separator can never match
+        patterns = [p for p in self.config["exclude_patterns"] if '/' not in p]
+        if patterns:
+            alternatives.append('|'.join(re.escape(p) for p in patterns))
+        self._exclude_regex = (
+            re.compile(f"(?:^|/)(?:{'|'.join(alternatives)})") if alternatives else None
+        )
+    
+    def _is_excluded(self, rel_path: str) -> bool:
+        """Check a posix path relative to root against the exclusion rules."""
+        return self._exclude_regex is not None and self._exclude_regex.search(rel_path) is not None
+    
     def _map_directory(self, directory: Path) -> Path:
         """Map directory for consistent handling of special paths like .github/workflows."""
         # Ensure we have a Path object
@@ -70,77 +189,69 @@ class SummaryGenerator:
             except ValueError:
                 pass
         
-        parts = list(directory.parts)
-        
-        # Handle .github/workflows mapping
-        for i, part in enumerate(parts[:-1]):  # Don't check last part if it's a file
-            if part == '.github' and i + 1 < len(parts) and parts[i + 1] == 'workflows':
-                parts[i] = 'github'
-                # If the original path was absolute, make result absolute
-                if directory.is_absolute():
-                    return self.root_dir / Path(*parts)
-                return Path(*parts)
-        
         # Return original path if no mapping needed
-        return directory
+        posix_path = directory.as_posix()
+        mapped = _map_posix_path(posix_path)
+        if mapped == posix_path:
+            return directory
+        return Path(mapped)
     
-    def _map_path_components(self, path: Path) -> Path:
-        """Map path components according to rules."""
-        mapped = self._map_directory(path)
-        
-        # If the mapped path is relative and we're generating files, make it absolute
-        if not mapped.is_absolute() and self.root_dir:
-            return self.root_dir / mapped
-        
-        return mapped
+    def _mapped_dir(self, rel_dir: str) -> Path:
+        """Get the output directory for a walked directory from its posix path relative to root."""
+        return self.root_dir / _map_posix_path(rel_dir) if rel_dir else self.root_dir
     
     def should_include_file(self, file_path: Path) -> bool:
         """Determine if a file should be included in the summary."""
         try:
-            # Special handling for workflow files
-            if '.github/workflows' in str(file_path):
-                return file_path.suffix in self.config["include_extensions"]
-            
-            # Handle non-existent files (for error handling test)
-            if not file_path.exists():
-                return True  # Allow non-existent files to trigger read errors later
-            
-            # Get path relative to root
             rel_path = file_path.resolve().relative_to(self.root_dir)
-            path_parts = rel_path.parts
-            
-            # Check directory exclusions first - this should take precedence
-            for excluded_dir in self.config["exclude_directories"]:
-                if excluded_dir in path_parts:
-                    return False
-            
-            # Check excluded patterns
-            for pattern in self.config["exclude_patterns"]:
-                if any(part == pattern or part.startswith(pattern) for part in path_parts):
-                    return False
-            
-            # Check extension - only if file passes exclusion filters
-            if file_path.suffix not in self.config["include_extensions"]:
-                return False
-                
-            # Check size if threshold is set
-            if self.max_file_size is not None:
-                try:
-                    if file_path.stat().st_size > self.max_file_size:
-                        return False
-                except OSError as e:
-                    logger.error(f"Error checking size of {file_path}: {e}")
-                    return False
-                    
-            return True
         except ValueError:
             return False
+        return self._should_include_rel(os.fspath(file_path), rel_path.as_posix())
+    
+    def _should_include_rel(self, path: str, rel_path: str) -> bool:
+        """Determine if a file should be included, given its path and posix path relative to root."""
+        # Check extension first - it is a pure string check, so files of
+        # unsupported types are rejected without touching the filesystem
+        if os.path.splitext(rel_path)[1] not in self._include_extensions:
+            return False
+        
+        # Special handling for workflow files
+        if _in_workflows_dir(rel_path.split('/')[:-1]):
+            return True
+        
+        # Check directory and pattern exclusions
+        if self._is_excluded(rel_path):
+            return False
+        
+        return self._within_size_limit(path)
+    
+    def _within_size_limit(self, path: str, entry: os.DirEntry | None = None) -> bool:
+        """Check that a file exists and does not exceed the size threshold."""
+        # A single stat serves as both the existence and the size check
+        try:
+            file_size = (entry.stat() if entry is not None else os.stat(path)).st_size
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.error(f"Error checking size of {path}: {e}")
+            return False
+        
+        # Check size if threshold is set
+        return self.max_file_size is None or file_size <= self.max_file_size
     
     def should_include_directory(self, directory: Path) -> bool:
         """Determine if a directory should have a summary generated."""
+        key = os.fspath(directory)
+        included = self._directory_cache.get(key)
+        if included is None:
+            included = self._directory_cache[key] = self._should_include_directory(Path(directory))
+        return included
+    
+    def _should_include_directory(self, directory: Path) -> bool:
+        """Uncached implementation of should_include_directory."""
         try:
             # Special handling for workflow directories
-            if '.github/workflows' in str(directory):
+            if _in_workflows_dir(directory.parts):
                 return True
             
             # Get path relative to root
@@ -156,83 +267,341 @@ class SummaryGenerator:
             # Include root directory
             return directory.resolve() == self.root_dir
     
-    def generate_directory_summary(self, directory: Path) -> str:
-        """Generate a summary for a single directory."""
+    def _should_include_rel_directory(self, rel_dir: str) -> bool:
+        """Determine if a walked directory should have a summary, given its relative path."""
+        parts = rel_dir.split('/') if rel_dir else []
+        if self._root_in_workflows or _in_workflows_dir([self.root_dir.name, *parts]):
+            return True
+        return self._excluded_directory_names.isdisjoint(parts)
+    
+    def _is_excluded_name(self, name: str) -> bool:
+        """Check a single path component against the exclusion rules."""
+        return name in self._excluded_directory_names or name.startswith(self._excluded_prefixes)
+    
+    def _is_excluded_directory_name(self, name: str) -> bool:
+        """Determine if a directory can be skipped without descending into it."""
+        # `.github` matches the `.git` pattern but has to be descended into
+        # so that workflow files are still picked up
+        if name == '.github':
+            return name in self._excluded_directory_names
+        return self._is_excluded_name(name)
+    
+    def _relative(self, path: str) -> str:
+        """Get the posix path relative to root of a path walked from under root."""
+        rel_path = path[len(self._root_prefix):]
+        return rel_path.replace(os.sep, '/') if os.sep != '/' else rel_path
+    
+    def _iter_files(self, directory: Path) -> Iterator[Tuple[str, str, List[os.DirEntry]]]:
+        """Walk a directory with os.scandir, pruning excluded subtrees before they are entered."""
+        stack = [os.fspath(directory)]
+        while stack:
+            dirpath = stack.pop()
+            try:
+                rel_dir, subdirectories, entries = self._scan_directory(dirpath)
+            except OSError as e:
+                logger.warning(f"Error listing {dirpath}: {e}")
+                continue
+            stack.extend(subdirectories)
+            yield dirpath, rel_dir, entries
+    
+    def _scan_directory(self, dirpath: str) -> Tuple[str, List[str], List[os.DirEntry]]:
+        """List one directory as (relative path, subdirectories to walk, non-directory entries)."""
+        rel_dir = self._relative(dirpath)
+        # An excluded .github directory is only entered for its workflows,
+        # so nothing else beneath it needs to be listed
+        workflows_only = (
+            os.path.basename(dirpath) == '.github'
+            and self._is_excluded_name('.github')
+            and not _in_workflows_dir(rel_dir.split('/'))
+        )
+        subdirectories = []
+        entries = []
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if workflows_only and entry.name != 'workflows':
+                        continue
+                    if not self._is_excluded_directory_name(entry.name):
+                        subdirectories.append(entry.path)
+                else:
+                    entries.append(entry)
+        return rel_dir, subdirectories, entries
+    
+    def _scan_and_filter(self, dirpath: str) -> Tuple[str, List[str], List[Tuple[str, str]]]:
+        """List one directory as (relative path, subdirectories to walk, included files)."""
+        try:
+            rel_dir, subdirectories, entries = self._scan_directory(dirpath)
+        except OSError as e:
+            logger.warning(f"Error listing {dirpath}: {e}")
+            return self._relative(dirpath), [], []
+        return rel_dir, subdirectories, self._filter_files(dirpath, rel_dir, entries)
+    
+    def _filter_files(
+        self, dirpath: str, rel_dir: str, entries: List[os.DirEntry]
+    ) -> List[Tuple[str, str]]:
+        """Select the included (path, relative path) pairs of one walked directory."""
+        include_extensions = self._include_extensions
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        candidates = [
+            (entry, prefix + entry.name) for entry in entries
+            if os.path.splitext(entry.name)[1] in include_extensions
+        ]
+        if not candidates:
+            return []
+        
+        in_workflows = _in_workflows_dir(rel_dir.split('/'))
+        directory_excluded = self._is_excluded(rel_dir)
+        return [
+            (entry.path, rel_path) for entry, rel_path in candidates
+            if entry.is_file() and (
+                self._should_include_symlink(entry.path) if entry.is_symlink()
+                else in_workflows or (
+                    not directory_excluded
+                    and not self._is_excluded_name(entry.name)
+                    and self._within_size_limit(entry.path, entry)
+                )
+            )
+        ]
+    
+    def _should_include_symlink(self, path: str) -> bool:
+        """Check a walked symlink by its target, as should_include_file does."""
+        real_path = os.path.realpath(path)
+        if not real_path.startswith(self._root_prefix):
+            return False
+        return self._should_include_rel(path, self._relative(real_path))
+    
+    def _iter_included_files(self, directory: Path) -> Iterator[Tuple[str, str]]:
+        """Yield (path, posix path relative to root) for included files under a directory."""
+        for dirpath, rel_dir, entries in self._iter_files(directory):
+            yield from self._filter_files(dirpath, rel_dir, entries)
+    
+    def generate_directory_summary(self, directory: Path, files: List[Path] | None = None) -> str:
+        """Generate a summary for a single directory, optionally from a precomputed file list."""
         logger.debug(f"Generating summary for {directory}")
-        summary = []
         
         try:
-            # Process all files in the directory
-            for file_path in sorted(directory.rglob('*')):
-                if not file_path.is_file() or not self.should_include_file(file_path):
-                    continue
-                    
-                try:
-                    rel_path = file_path.relative_to(self.root_dir)
-                    content = file_path.read_text(encoding='utf-8')
-                    
-                    summary.extend([
-                        '---',
-                        f'File: {rel_path}',
-                        '---',
-                        content,
-                        '\n'
-                    ])
-                except Exception as e:
-                    logger.error(f"Error processing {file_path}: {e}")
-                    
-            return '\n'.join(summary)
+            directory = Path(directory).resolve()
+            if files is None:
+                if directory != self.root_dir and self.root_dir not in directory.parents:
+                    return ""
+                entries = list(self._iter_included_files(directory))
+            else:
+                entries = [
+                    (os.fspath(f), f.resolve().relative_to(self.root_dir).as_posix())
+                    for f in files
+                ]
+            # Order by path components, matching a sorted walk of the tree
+            entries.sort(key=lambda entry: entry[1].split('/'))
+            
+            buffer = io.BytesIO()
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                sections = self._read_sections(entries, executor)
+            self._write_summary(entries, buffer, sections)
+            return buffer.getvalue().decode('utf-8', errors='replace')
         except Exception as e:
             logger.error(f"Error generating summary for {directory}: {e}")
             return ""
     
+    def _read_section(self, path: str, rel_path: str) -> Tuple[int, int, bytes, bytes] | None:
+        """Read a file into its (mtime_ns, size, section, digest), or None to copy it from disk."""
+        try:
+            stat = os.stat(path)
+            cached = self._section_cache.get(rel_path)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return cached
+            # Large files stay out of memory and are sent into each summary from disk
+            if stat.st_size > SENDFILE_THRESHOLD:
+                return None
+            content = _read_whole(path, stat.st_size)
+        except OSError:
+            return None
+        # Joined in one go, so the contents are only copied once
+        section = b''.join((
+            SECTION_HEADER_START, os.fsencode(rel_path), SECTION_HEADER_END, content, SECTION_END
+        ))
+        return stat.st_mtime_ns, stat.st_size, section, hashlib.blake2b(section, digest_size=16).digest()
+    
+    def _read_sections(
+        self, files: List[Tuple[str, str]], executor: ThreadPoolExecutor
+    ) -> Dict[str, bytes]:
+        """Read the sections of files concurrently into the section cache, returning them by path."""
+        results = executor.map(lambda file: self._read_section(*file), files)
+        sections = {}
+        for (path, rel_path), result in zip(files, results):
+            if result is not None:
+                self._section_cache[rel_path] = result
+                sections[path] = result[2]
+        return sections
+    
+    def _write_summary(
+        self,
+        files: List[Tuple[str, str]],
+        out: BinaryIO,
+        sections: Dict[str, bytes] | None = None,
+    ) -> int:
+        """Stream files into a binary output as summary sections, returning how many were written."""
+        written = 0
+        for path, rel_path in files:
+            try:
+                section = sections.get(path) if sections is not None else None
+                if section is not None:
+                    if written:
+                        out.write(b'\n')
+                    out.write(section)
+                else:
+                    with open(path, 'rb') as src:
+                        if written:
+                            out.write(b'\n')
+                        out.write(_section_header(rel_path))
+                        _copy_file(src, out)
+                        out.write(SECTION_END)
+                written += 1
+            except Exception as e:
+                logger.error(f"Error processing {path}: {e}")
+        return written
+    
+    def _summary_digest(self, files: List[Tuple[str, str]], sections: Dict[str, bytes]) -> bytes:
+        """Digest the inputs of a summary without hashing any file contents."""
+        digest = hashlib.blake2b(digest_size=16)
+        for path, rel_path in files:
+            if path in sections:
+                digest.update(b'S')
+                digest.update(self._section_cache[rel_path][3])
+                continue
+            try:
+                stat = os.stat(path)
+                identity = repr((rel_path, stat.st_mtime_ns, stat.st_size)).encode()
+            except OSError:
+                identity = repr((rel_path, None, None)).encode()
+            digest.update(b'F')
+            digest.update(len(identity).to_bytes(8, 'little'))
+            digest.update(identity)
+        return digest.digest()
+    
+    def _write_directory_summary(
+        self,
+        rel_dir: str,
+        files: List[Tuple[str, str]],
+        summary_path: Path,
+        sections: Dict[str, bytes],
+    ) -> Path | None:
+        """Write one directory's SUMMARY atomically, unless its inputs are unchanged."""
+        digest = self._summary_digest(files, sections)
+        previous = self._summary_digests.get(rel_dir)
+        if previous is not None and previous[2] == digest:
+            try:
+                stat = os.stat(summary_path)
+            except OSError:
+                stat = None
+            if stat is not None and (stat.st_mtime_ns, stat.st_size) == previous[:2]:
+                with self._skipped_lock:
+                    self.skipped_writes += 1
+                logger.debug(f"Summary for {rel_dir or '.'} is unchanged")
+                return summary_path
+        
+        tmp_path = summary_path.with_name(f"{summary_path.name}.tmp.{os.getpid()}")
+        try:
+            with open(tmp_path, 'wb') as out:
+                written = self._write_summary(files, out, sections)
+            if written:
+                os.replace(tmp_path, summary_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        if not written:  # Only keep summary if there's content
+            summary_path.unlink(missing_ok=True)
+            self._summary_digests.pop(rel_dir, None)
+            return None
+        stat = os.stat(summary_path)
+        self._summary_digests[rel_dir] = (stat.st_mtime_ns, stat.st_size, digest)
+        logger.info(f"Generated summary for {rel_dir or '.'} -> {summary_path}")
+        return summary_path
+    
     def generate_all_summaries(self) -> List[Path]:
         """Generate summary files for all directories."""
         logger.info("Starting summary generation")
-        summary_files = []
+        self.skipped_writes = 0
         
         try:
-            directories = self._collect_directories()
-            logger.info(f"Found {len(directories)} directories to process")
-            
-            for directory in sorted(directories):
-                if not self.should_include_directory(directory):
-                    continue
-                
-                # Map the directory path
-                mapped_dir = self._map_path_components(directory)
-                if mapped_dir:
-                    mapped_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    summary_content = self.generate_directory_summary(directory)
-                    if summary_content:  # Only create summary if there's content
-                        summary_path = mapped_dir / 'SUMMARY'
-                        summary_path.write_text(summary_content)
-                        logger.info(f"Generated summary for {directory} -> {summary_path}")
-                        summary_files.append(summary_path)
-                    
-            return summary_files
-            
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                return self._generate_all_summaries(executor)
         except Exception as e:
             logger.error(f"Error generating summaries: {e}")
             return []
+    
+    def _generate_all_summaries(self, executor: ThreadPoolExecutor) -> List[Path]:
+        """Generate summary files for all directories, running I/O on executor."""
+        directories = self._collect_directories(executor)
+        logger.info(f"Found {len(directories)} directories to process")
+        
+        # Each summary covers the whole subtree, so hand every directory
+        # the included files of its descendants as well as its own.
+        # Ancestors are found by trimming the relative path, with root as ''
+        subtree_files: Dict[str, List[Tuple[str, str]]] = {
+            rel_dir: [] for rel_dir in directories
+        }
+        summarized_ancestors: Dict[str, List[str]] = {}
+        for rel_dir in directories:
+            ancestors = summarized_ancestors[rel_dir] = []
+            ancestor = rel_dir
+            while True:
+                if ancestor in subtree_files:
+                    ancestors.append(ancestor)
+                if not ancestor:
+                    break
+                ancestor = ancestor.rpartition('/')[0]
+        
+        # Sort all files once, by path components to match a sorted walk
+        # of the tree, so every subtree's list is built already in order
+        ordered_files = sorted(
+            ((rel_dir, file) for rel_dir, files in directories.items() for file in files),
+            key=lambda item: item[1][1].split('/'),
+        )
+        for rel_dir, file in ordered_files:
+            for ancestor in summarized_ancestors[rel_dir]:
+                subtree_files[ancestor].append(file)
+        
+        jobs = []
+        # Order by path components, as sorting the directory paths would
+        for rel_dir in sorted(directories, key=lambda rel: rel.split('/')):
+            # Map the directory path
+            mapped_dir = self._mapped_dir(rel_dir)
+            mapped_dir.mkdir(parents=True, exist_ok=True)
+            jobs.append((rel_dir, subtree_files[rel_dir], mapped_dir / 'SUMMARY'))
+        
+        # Read every file once up front, sharing its formatted section
+        # between all the summaries it appears in
+        all_files = [file for files in directories.values() for file in files]
+        sections = self._read_sections(all_files, executor)
+        # Forget files that are no longer part of any summary
+        for rel_path in self._section_cache.keys() - {rel for _, rel in all_files}:
+            del self._section_cache[rel_path]
+        for rel_dir in self._summary_digests.keys() - directories.keys():
+            del self._summary_digests[rel_dir]
+        # Directories are independent of each other, so write them concurrently
+        results = executor.map(
+            lambda job: self._write_directory_summary(*job, sections), jobs
+        )
+        return [summary_path for summary_path in results if summary_path is not None]
             
-    def _collect_directories(self) -> Set[Path]:
-        """Collect all directories containing files to summarize."""
-        directories = set()
+    def _collect_directories(
+        self, executor: ThreadPoolExecutor
+    ) -> Dict[str, List[Tuple[str, str]]]:
+        """Map each included directory's relative path to the included files directly inside it."""
+        directories: Dict[str, List[Tuple[str, str]]] = {}
         try:
-            for file_path in self.root_dir.rglob('*'):
-                if (file_path.is_file() and 
-                    self.should_include_file(file_path) and
-                    self.should_include_directory(file_path.parent)):
-                    directories.add(file_path.parent)
+            # Walked a level at a time, listing each level's directories concurrently
+            level = [os.fspath(self.root_dir)]
+            while level:
+                next_level = []
+                for rel_dir, subdirectories, included in executor.map(self._scan_and_filter, level):
+                    next_level.extend(subdirectories)
+                    if not included:
+                        continue
+                    
+                    if self._should_include_rel_directory(rel_dir):
+                        directories[rel_dir] = included
+                level = next_level
                     
-                    # Special case for .github/workflows
-                    if '.github/workflows' in str(file_path):
-                        workflows_dir = file_path.parent
-                        if workflows_dir.name == 'workflows' and workflows_dir.parent.name == '.github':
-                            directories.add(workflows_dir)
-                            
         except Exception as e:
             logger.error(f"Error collecting directories: {e}")
         return directories
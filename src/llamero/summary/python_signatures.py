@@ -1,5 +1,6 @@
 """Extracts and formats Python code signatures with proper nesting."""
 import ast
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Dict
@@ -171,6 +172,21 @@ class SignatureExtractor:
         
         return lines
 
+def _find_python_files(root_dir: Path) -> List[Path]:
+    """Find Python files under root_dir, skipping hidden and __pycache__ directories.
+    
+    Walks the tree once with os.walk, pruning skipped directories in place
+    so they are never descended into.
+    """
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.') and d != '__pycache__']
+        files.extend(
+            os.path.join(dirpath, name) for name in filenames
+            if name.endswith('.py') and not name.startswith('.')
+        )
+    return sorted(map(Path, files))
+
 def generate_python_summary(root_dir: str | Path) -> str:
     """Generate enhanced Python project structure summary.
     
@@ -184,12 +200,7 @@ def generate_python_summary(root_dir: str | Path) -> str:
     extractor = SignatureExtractor()
     content = ["# Python Project Structure\n"]
     
-    for file in sorted(root_dir.rglob("*.py")):
-        if any(part.startswith('.') for part in file.parts):
-            continue
-        if '__pycache__' in file.parts:
-            continue
-            
+    for file in _find_python_files(root_dir):
         try:
             # Get relative path
             rel_path = file.relative_to(root_dir)
@@ -1,9 +1,26 @@
+import os
+from functools import lru_cache
 from pathlib import Path
 from loguru import logger
 from tree_format import format_tree
 from .utils import load_config
 
 
+@lru_cache(maxsize=64)
+def _compile_ignore_patterns(ignore_patterns: tuple[str, ...]) -> tuple[tuple[str, ...], frozenset[str]]:
+    """
+    Splits ignore patterns into path suffixes and exact component names.
+    
+    Args:
+        ignore_patterns: Ignore patterns from the config
+        
+    Returns:
+        Tuple of (suffixes of extension patterns like *.pyc, names to match exactly)
+    """
+    suffixes = tuple(pattern[1:] for pattern in ignore_patterns if pattern.startswith('*'))
+    names = frozenset(pattern for pattern in ignore_patterns if not pattern.startswith('*'))
+    return suffixes, names
+
 def should_include_path(path: Path, config: dict) -> bool:
     """
     Determines if a path should be included based on config ignore patterns.
@@ -22,15 +39,17 @@ def should_include_path(path: Path, config: dict) -> bool:
     parts = path.parts
     if not parts:  # Handle empty path
         return True
-        
-    for pattern in ignore_patterns:
-        # Handle file extension patterns (e.g. *.pyc)
-        if pattern.startswith('*'):
-            if str(path).endswith(pattern[1:]):
-                return False
-        # Handle directory/file name patterns
-        elif pattern in parts or (pattern == str(path.name)):
-            return False
+    
+    # Patterns are compiled once per distinct pattern list, so each path
+    # is checked with a single suffix test and a set lookup per component
+    suffixes, names = _compile_ignore_patterns(tuple(ignore_patterns))
+    
+    # Handle file extension patterns (e.g. *.pyc)
+    if suffixes and str(path).endswith(suffixes):
+        return False
+    # Handle directory/file name patterns
+    if not names.isdisjoint(parts) or path.name in names:
+        return False
     return True
 
 def node_to_tree(path: Path, config: dict) -> tuple[str, list] | None:
@@ -50,16 +69,52 @@ def node_to_tree(path: Path, config: dict) -> tuple[str, list] | None:
         
     if path.is_file():
         return path.name, []
+    
+    ignore_patterns = config.get("tool", {}).get("readme", {}).get("tree", {}).get("ignore_patterns", [])
+    suffixes, names = _compile_ignore_patterns(tuple(ignore_patterns))
+    return _directory_to_tree(str(path), path.name, suffixes, names)
+
+def _directory_to_tree(
+    path: str, name: str, suffixes: tuple[str, ...], names: frozenset[str]
+) -> tuple[str, list] | None:
+    """
+    Converts an included directory to a tree structure, working on path strings.
+    
+    Children are listed with os.scandir, whose entries carry their file type,
+    so no Path objects or extra stat calls are needed per entry. The directory
+    itself has already passed should_include_path, so each child only needs
+    its own name and the end of its path checked against the ignore patterns.
+    
+    Args:
+        path: Directory path, as str() of the Path it was reached through
+        name: Name of the directory node
+        suffixes: Compiled extension patterns
+        names: Compiled name patterns
+        
+    Returns:
+        Tuple of (node_name, child_nodes) or None if the directory is empty
+    """
+    with os.scandir(path) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    
+    children = []
+    for entry in entries:
+        if entry.name in names:
+            continue
+        # Same string str(Path(path) / entry.name) would give
+        child_path = entry.name if path == '.' else os.path.join(path, entry.name)
+        if suffixes and child_path.endswith(suffixes):
+            continue
         
-    children = [
-        node for child in sorted(path.iterdir())
-        if (node := node_to_tree(child, config)) is not None
-    ]
+        if entry.is_file():
+            children.append((entry.name, []))
+        elif (node := _directory_to_tree(child_path, entry.name, suffixes, names)) is not None:
+            children.append(node)
     
-    if not children and path.name not in {'docs', 'src'}:
+    if not children and name not in {'docs', 'src'}:
         return None
         
-    return path.name, children
+    return name, children
 
 def generate_tree(root_dir: str = ".") -> str:
     """
@@ -1,46 +1,95 @@
+from functools import lru_cache
 from pathlib import Path
-import tomli
+import tomllib
 import os
 import subprocess
 from loguru import logger
 
+# Project roots found so far, by starting directory
+_project_roots: dict[str, Path] = {}
+
+def _find_project_root(start: str) -> Path | None:
+    """
+    Find the nearest directory at or above start containing pyproject.toml
+    
+    Roots found are remembered per starting directory and only rechecked
+    with a single stat. Misses are not remembered, so a pyproject.toml
+    created later is still found.
+    """
+    root = _project_roots.get(start)
+    if root is not None and (root / 'pyproject.toml').exists():
+        return root
+    current = Path(start)
+    while current != current.parent:
+        if (current / 'pyproject.toml').exists():
+            _project_roots[start] = current
+            return current
+        current = current.parent
+    return None
+
 def get_project_root() -> Path:
     """
     Get the project root directory by looking for pyproject.toml
     Returns the absolute path to the project root
     """
-    current = Path.cwd().absolute()
+    cwd = Path.cwd().absolute()
     
     # Look for pyproject.toml in current and parent directories
-    while current != current.parent:
-        if (current / 'pyproject.toml').exists():
-            return current
-        current = current.parent
+    root = _find_project_root(str(cwd))
+    if root is not None:
+        return root
     
     # If we couldn't find it, use the current working directory
     # and log a warning
     logger.warning("Could not find pyproject.toml in parent directories")
-    return Path.cwd().absolute()
+    return cwd
+
+@lru_cache(maxsize=None)
+def _parse_toml(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a TOML file, memoized on its path and stat metadata
+    
+    The mtime and size only serve as cache keys, so editing the file
+    invalidates the cached result.
+    """
+    with open(path, "rb") as f:
+        return tomllib.load(f)
 
 def load_config(config_path: str) -> dict:
     """
     Load configuration from a TOML file
     
+    Parsed results are cached per process, so the returned dict is shared
+    between callers and should be treated as read-only.
+    
     Args:
-        config_path (str): Path to the TOML configuration file relative to project root
+        config_path (str): Path to the TOML configuration file relative to project root,
+            or an absolute path, which is used as is
         
     Returns:
         dict: Parsed configuration data
     """
 
-    full_path = get_project_root() / config_path
-    if full_path.exists():
-        logger.debug(f"Attempting to load config from: {full_path}")
-        with open(full_path, "rb") as f:
-            return tomli.load(f)
-    else:
+    full_path = Path(config_path)
+    if not full_path.is_absolute():
+        full_path = get_project_root() / config_path
+    try:
+        stat = full_path.stat()
+    except FileNotFoundError:
         #logger.error(f"Configuration file not found: {full_path}")
-        raise FileNotFoundError(f"Configuration file not found: {full_path}")
+        raise FileNotFoundError(f"Configuration file not found: {full_path}") from None
+    logger.debug(f"Attempting to load config from: {full_path}")
+    return _parse_toml(str(full_path), stat.st_mtime_ns, stat.st_size)
+
+def _git_identity_env(name: str, email: str) -> dict:
+    """Build an environment that makes git commit as the given identity"""
+    return {
+        **os.environ,
+        "GIT_AUTHOR_NAME": name,
+        "GIT_AUTHOR_EMAIL": email,
+        "GIT_COMMITTER_NAME": name,
+        "GIT_COMMITTER_EMAIL": email,
+    }
 
 def commit_and_push(files_to_commit: str|Path|list[str]|list[Path], message = None):
     """Commit and push changes for a specific file"""
@@ -49,9 +98,9 @@ def commit_and_push(files_to_commit: str|Path|list[str]|list[Path], message = No
     files_to_commit = [str(f) for f in files_to_commit] # Ensure Path objects are stringified
     logger.info(f"files to commit: {files_to_commit}")
     try:
-        # Configure Git for GitHub Actions
-        subprocess.run(["git", "config", "--global", "user.name", "GitHub Action"], check=True)
-        subprocess.run(["git", "config", "--global", "user.email", "action@github.com"], check=True)
+        # Commit as GitHub Actions through the environment, rather than
+        # spawning `git config` processes that rewrite the global config
+        git_env = _git_identity_env("GitHub Action", "action@github.com")
 
         #changes = False
         files_staged = []
@@ -70,7 +119,7 @@ def commit_and_push(files_to_commit: str|Path|list[str]|list[Path], message = No
                 message = f"Update {file_to_commit}"
             else:
                 message = f"Updated {len(files_staged)} files."
-        subprocess.run(["git", "commit", "-m", message], check=True)
+        subprocess.run(["git", "commit", "-m", message], check=True, env=git_env)
         subprocess.run(["git", "push"], check=True)
         
         logger.success(f"Changes to {files_staged} committed and pushed successfully")
@@ -101,43 +150,44 @@ def commit_and_push_to_branch(
     # Convert paths to strings
     path_strs = [str(p) for p in paths]
     
-    # Set up git config
-    subprocess.run(["git", "config", "--local", "user.email", "github-actions[bot]@users.noreply.github.com"])
-    subprocess.run(["git", "config", "--local", "user.name", "github-actions[bot]"])
+    # Identity for every git call below, so a pull that has to merge works
+    # on runners without a configured identity too
+    git_env = _git_identity_env("github-actions[bot]", "github-actions[bot]@users.noreply.github.com")
     
     if force:
         # Create fresh branch from base_branch or HEAD
         base = base_branch or "HEAD"
         logger.info(f"Creating fresh branch {branch} from {base}")
-        subprocess.run(["git", "checkout", "-B", branch, base])
+        subprocess.run(["git", "checkout", "-B", branch, base], env=git_env)
     else:
         # Normal branch handling
         if base_branch:
             logger.info(f"Creating new branch {branch} from {base_branch}")
-            subprocess.run(["git", "checkout", "-b", branch, base_branch])
+            subprocess.run(["git", "checkout", "-b", branch, base_branch], env=git_env)
         else:
             logger.info(f"Switching to branch {branch}")
-            subprocess.run(["git", "checkout", "-b", branch])
-            subprocess.run(["git", "pull", "origin", branch], capture_output=True)
+            subprocess.run(["git", "checkout", "-b", branch], env=git_env)
+            subprocess.run(["git", "pull", "origin", branch], capture_output=True, env=git_env)
     
     # Stage and commit changes
-    subprocess.run(["git", "add", *path_strs])
+    subprocess.run(["git", "add", *path_strs], env=git_env)
     
     # Only commit if there are changes
     result = subprocess.run(
         ["git", "diff", "--staged", "--quiet"],
-        capture_output=True
+        capture_output=True,
+        env=git_env
     )
     if result.returncode == 1:  # Changes exist
         logger.info("Committing changes")
-        subprocess.run(["git", "commit", "-m", message])
+        subprocess.run(["git", "commit", "-m", message], env=git_env)
         
         # Push changes
         if force:
             logger.info(f"Force pushing {branch} branch")
-            subprocess.run(["git", "push", "-f", "origin", branch])
+            subprocess.run(["git", "push", "-f", "origin", branch], env=git_env)
         else:
             logger.info("Pushing changes")
-            subprocess.run(["git", "push", "origin", branch])
+            subprocess.run(["git", "push", "origin", branch], env=git_env)
     else:
         logger.info("No changes to commit")
@@ -4,6 +4,7 @@ from pathlib import Path
 import tempfile
 import shutil
 import os
+import subprocess
 import logging
 import sys
 from loguru import logger
@@ -59,14 +60,10 @@ def setup_logging(caplog):
     # Clean up
     logger.remove(handler_id)
 
-@pytest.fixture
-def temp_project_dir():
-    """Create a temporary project directory with a pyproject.toml."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir)
-        
-        # Create minimal pyproject.toml
-        pyproject_content = """
+def _populate_project(tmp_path: Path):
+    """Write the minimal test project into tmp_path."""
+    # Create minimal pyproject.toml
+    pyproject_content = """
 [project]
 name = "test-project"
 description = "Test project"
@@ -76,14 +73,14 @@ requires-python = ">=3.11"
 [tool.llamero]
 verbose = true
 """
-        (tmp_path / "pyproject.toml").write_text(pyproject_content)
-        
-        # Create some test files and directories
-        src_dir = tmp_path / "src" / "test_project"
-        src_dir.mkdir(parents=True)
-        
-        # Sample Python file
-        (src_dir / "main.py").write_text("""
+    (tmp_path / "pyproject.toml").write_text(pyproject_content)
+    
+    # Create some test files and directories
+    src_dir = tmp_path / "src" / "test_project"
+    src_dir.mkdir(parents=True)
+    
+    # Sample Python file
+    (src_dir / "main.py").write_text("""
 def hello():
     \"\"\"Say hello.\"\"\"
     return "Hello, world!"
@@ -94,20 +91,41 @@ class TestClass:
         \"\"\"A test method.\"\"\"
         return True
 """)
-        
-        # Sample README
-        (tmp_path / "README.md").write_text("# Test Project\n\nThis is a test.")
-        
+    
+    # Sample README
+    (tmp_path / "README.md").write_text("# Test Project\n\nThis is a test.")
+
+@pytest.fixture
+def temp_project_dir():
+    """Create a temporary project directory with a pyproject.toml."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        _populate_project(tmp_path)
         yield tmp_path
 
+@pytest.fixture(scope="session")
+def git_repo_template(tmp_path_factory):
+    """Create the test project's git history once per session.
+    
+    Initializing and committing spawns several git processes, so tests get
+    a copy of the resulting .git directory instead of repeating them.
+    """
+    template = tmp_path_factory.mktemp("git_repo_template")
+    _populate_project(template)
+    for command in (
+        ["git", "init"],
+        ["git", "config", "user.name", "Test User"],
+        ["git", "config", "user.email", "test@example.com"],
+        ["git", "add", "."],
+        ["git", "commit", "-m", "Initial commit"],
+    ):
+        subprocess.run(command, cwd=template, check=True, capture_output=True)
+    return template / ".git"
+
 @pytest.fixture
-def mock_git_repo(temp_project_dir):
+def mock_git_repo(temp_project_dir, git_repo_template):
     """Create a temporary git repository."""
     os.chdir(temp_project_dir)
-    os.system("git init")
-    os.system("git config user.name 'Test User'")
-    os.system("git config user.email 'test@example.com'")
-    os.system("git add .")
-    os.system("git commit -m 'Initial commit'")
+    shutil.copytree(git_repo_template, temp_project_dir / ".git")
     yield temp_project_dir
     os.chdir(os.path.dirname(temp_project_dir))
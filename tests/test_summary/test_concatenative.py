@@ -1,4 +1,5 @@
 # tests/test_summary/test_concatenative.py
+import os
 import pytest
 from pathlib import Path
 from llamero.summary.concatenative import SummaryGenerator
@@ -267,3 +268,152 @@ def test_excluded_directory_files(test_files):
         content = summary_file.read_text()
         assert "_excluded_test.py" not in content
         assert "should be excluded" not in content
+
+def test_config_not_shared_between_instances(config_project_dir, temp_project_dir):
+    """Test that mutating one generator's config does not leak into others."""
+    # User config comes from the cached pyproject.toml parse
+    generator = SummaryGenerator(config_project_dir)
+    generator.config['exclude_patterns'].append('leaked')
+    assert 'leaked' not in SummaryGenerator(config_project_dir).config['exclude_patterns']
+    
+    # Defaults come from the class attribute
+    (temp_project_dir / "pyproject.toml").write_text('[project]\nname = "test-project"\n')
+    generator = SummaryGenerator(temp_project_dir)
+    generator.config['exclude_directories'].append('leaked')
+    assert 'leaked' not in SummaryGenerator.DEFAULT_CONFIG['exclude_directories']
+
+def test_missing_file_excluded(temp_project_dir):
+    """Test that files which do not exist are not included."""
+    generator = SummaryGenerator(temp_project_dir)
+    assert not generator.should_include_file(temp_project_dir / "missing.py")
+
+def test_symlinks_checked_by_target(temp_project_dir, tmp_path_factory):
+    """Test that symlinks escaping the root or into excluded trees are left out."""
+    outside = tmp_path_factory.mktemp("outside") / "secret.txt"
+    outside.write_text("SECRET=1")
+    docs = temp_project_dir / "docs"
+    docs.mkdir()
+    (docs / "a.md").write_text("# Docs")
+    (temp_project_dir / ".venv").mkdir()
+    (temp_project_dir / ".venv" / "v.py").write_text("venv = True")
+    (docs / "link.txt").symlink_to(outside)
+    (docs / "v.py").symlink_to(Path("..") / ".venv" / "v.py")
+    (docs / "readme.md").symlink_to(Path("a.md"))
+    
+    generator = SummaryGenerator(temp_project_dir)
+    assert not generator.should_include_file(docs / "link.txt")
+    assert not generator.should_include_file(docs / "v.py")
+    generator.generate_all_summaries()
+    
+    content = (docs / "SUMMARY").read_text()
+    assert "SECRET=1" not in content
+    assert "venv = True" not in content
+    assert "File: docs/a.md" in content
+    assert "File: docs/readme.md" in content
+
+def test_large_file_contents_preserved(temp_project_dir, monkeypatch):
+    """Test that files copied in-kernel keep their contents and position."""
+    large_content = "\n".join(f"line {i}" for i in range(20000))  # ~150KB
+    (temp_project_dir / "a_large.txt").write_text(large_content)
+    (temp_project_dir / "b_small.txt").write_text("small")
+    
+    sent = []
+    if hasattr(os, "sendfile"):
+        sendfile = os.sendfile
+        monkeypatch.setattr(
+            os, "sendfile",
+            lambda *args: sent.append(args[3]) or sendfile(*args)
+        )
+    
+    generator = SummaryGenerator(temp_project_dir)
+    summary_files = generator.generate_all_summaries()
+    
+    if hasattr(os, "sendfile"):
+        assert sent, "large file was not copied with os.sendfile"
+    # Large files are streamed from disk rather than held in the section cache
+    assert "a_large.txt" not in generator._section_cache
+    assert "b_small.txt" in generator._section_cache
+    root_summary = temp_project_dir / "SUMMARY"
+    assert root_summary in summary_files
+    content = root_summary.read_text()
+    assert f"File: a_large.txt\n---\n{large_content}\n\n" in content
+    assert content.index("File: a_large.txt") < content.index("File: b_small.txt")
+    assert generator.generate_directory_summary(temp_project_dir) == content
+
+def test_nested_file_sections_shared(temp_project_dir):
+    """Test that a nested file's section is identical in every summary it appears in."""
+    nested = temp_project_dir / "pkg" / "sub"
+    nested.mkdir(parents=True)
+    (nested / "module.py").write_text("def f():\n    pass\n")
+    (nested.parent / "__init__.py").write_text("")
+    
+    generator = SummaryGenerator(temp_project_dir)
+    generator.generate_all_summaries()
+    
+    section = "---\nFile: pkg/sub/module.py\n---\ndef f():\n    pass\n\n\n"
+    assert (nested / "SUMMARY").read_text() == section
+    assert (nested.parent / "SUMMARY").read_text().endswith("\n" + section)
+
+def test_summary_written_atomically(temp_project_dir):
+    """Test that regenerating summaries replaces them without leaving temporary files."""
+    (temp_project_dir / "module.py").write_text("print('hello')")
+    
+    generator = SummaryGenerator(temp_project_dir)
+    generator.generate_all_summaries()
+    (temp_project_dir / "module.py").write_text("print('updated')")
+    generator.generate_all_summaries()
+    
+    assert "print('updated')" in (temp_project_dir / "SUMMARY").read_text()
+    assert not list(temp_project_dir.rglob("SUMMARY.tmp.*"))
+
+def test_unchanged_files_not_reread(temp_project_dir, monkeypatch):
+    """Test that repeated runs reuse sections of files that have not changed."""
+    from llamero.summary import concatenative
+    (temp_project_dir / "stable.py").write_text("stable = True")
+    (temp_project_dir / "changing.py").write_text("version = 1")
+    
+    generator = SummaryGenerator(temp_project_dir)
+    generator.generate_all_summaries()
+    
+    reads = []
+    read_whole = concatenative._read_whole
+    monkeypatch.setattr(
+        concatenative, "_read_whole",
+        lambda path, size: reads.append(Path(path).name) or read_whole(path, size)
+    )
+    (temp_project_dir / "changing.py").write_text("version = 22")
+    generator.generate_all_summaries()
+    
+    assert reads == ["changing.py"]
+    content = (temp_project_dir / "SUMMARY").read_text()
+    assert "version = 22" in content
+    assert "stable = True" in content
+
+def test_unchanged_summaries_not_rewritten(temp_project_dir):
+    """Test that a run with no changes leaves existing summaries untouched."""
+    (temp_project_dir / "module.py").write_text("print('hello')")
+    
+    generator = SummaryGenerator(temp_project_dir)
+    summaries = generator.generate_all_summaries()
+    assert generator.skipped_writes == 0
+    
+    assert generator.generate_all_summaries() == summaries
+    assert generator.skipped_writes == len(summaries)
+    
+    # Large files are not held in memory, but changes to them are still picked up
+    large_content = "\n".join(f"line {i}" for i in range(20000))
+    (temp_project_dir / "large.txt").write_text(large_content)
+    generator.generate_all_summaries()
+    assert generator.skipped_writes == len(summaries) - 1
+    generator.generate_all_summaries()
+    assert generator.skipped_writes == len(summaries)
+    (temp_project_dir / "large.txt").write_text(large_content + "\nmore")
+    generator.generate_all_summaries()
+    assert generator.skipped_writes == len(summaries) - 1
+    assert large_content + "\nmore" in (temp_project_dir / "SUMMARY").read_text()
+    
+    # Summaries edited by hand are regenerated
+    (temp_project_dir / "SUMMARY").write_text("stale")
+    generator.generate_all_summaries()
+    assert generator.skipped_writes == len(summaries) - 1
+    assert "print('hello')" in (temp_project_dir / "SUMMARY").read_text()
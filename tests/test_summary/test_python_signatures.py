@@ -72,3 +72,20 @@ class TestClass:
     ]
     for fragment in expected_fragments:
         assert fragment in summary, f"Missing expected content: {fragment}"
+
+
+def test_signature_extraction_uses_extractor_instance():
+    """Test that extraction runs on the extractor itself, including subclasses."""
+    class PrefixedExtractor(SignatureExtractor):
+        def __init__(self, prefix):
+            self.prefix = prefix
+        
+        def get_arg_string(self, args):
+            return self.prefix + super().get_arg_string(args)
+    
+    source = """
+def func(a):
+    pass
+"""
+    signatures = PrefixedExtractor("x_").extract_signatures(source)
+    assert signatures[0].args == ["x_a"]
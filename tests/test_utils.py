@@ -18,6 +18,16 @@ def test_get_project_root_subfolder(temp_project_dir):
     root = get_project_root()
     assert root == temp_project_dir
 
+def test_get_project_root_created_later(tmp_path):
+    """Test that a pyproject.toml created after a failed lookup is found."""
+    subfolder = tmp_path / "sub"
+    subfolder.mkdir()
+    os.chdir(subfolder)
+    assert get_project_root() == subfolder
+    
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "late-project"\n')
+    assert get_project_root() == tmp_path
+
 def test_load_config(temp_project_dir):
     """Test configuration loading."""
     os.chdir(temp_project_dir)
@@ -29,3 +39,18 @@ def test_load_config_missing():
     """Test loading missing configuration."""
     with pytest.raises(FileNotFoundError):
         load_config("nonexistent.toml")
+
+def test_load_config_picks_up_changes(temp_project_dir):
+    """Test that cached configuration is invalidated when the file changes."""
+    os.chdir(temp_project_dir)
+    assert load_config("pyproject.toml") is load_config("pyproject.toml")
+    
+    (temp_project_dir / "pyproject.toml").write_text('[project]\nname = "renamed-project"\n')
+    config = load_config("pyproject.toml")
+    assert config["project"]["name"] == "renamed-project"
+
+def test_load_config_absolute_path(temp_project_dir, tmp_path):
+    """Test that absolute config paths are loaded without a project root lookup."""
+    os.chdir(tmp_path)
+    config = load_config(str(temp_project_dir / "pyproject.toml"))
+    assert "tool" in config